@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
+# Incremental, parallel build reusing the pickled doctrees:
+#   sphinx-build -j auto -d _build/doctrees -b html . _build/html
 
 from __future__ import division, print_function, unicode_literals
 
-from datetime import datetime
+import os
 
 extensions = ["sphinx.ext.autodoc", "autoapi.extension"]
 autoapi_dirs = ["../sagemaker_rightline"]
@@ -10,7 +12,7 @@ templates_path = ["templates", "_templates", ".templates"]
 source_suffix = [".rst"]
 master_doc = "index"
 project = "sagemaker-rightline"
-copyright = str(datetime.now().year)
+copyright = os.environ.get("SPHINX_COPYRIGHT_YEAR", "2026")
 version = "stable"
 release = "stable"
 exclude_patterns = ["_build"]
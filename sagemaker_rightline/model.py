@@ -1,19 +1,169 @@
 import logging
 import re
 from abc import ABC, abstractmethod
-from copy import copy
-from dataclasses import dataclass
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import asdict, dataclass
+from functools import lru_cache, partial
+from itertools import chain
 from operator import attrgetter
-from typing import Any, Iterable, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import pandas as pd
 from sagemaker.workflow.pipeline import Pipeline
 
+_FILTER_RE = re.compile(r"\[(.*?)\]")
+# <attribute> or <attribute>[<conditions>]
+_PATH_SEGMENT_RE = re.compile(r"^[^\[\]]+(\[[^\[\]]*\])?$")
+_MISSING = object()
+T = TypeVar("T")
+
+# Cache shared by the validations of a single Configuration.run. Worker threads started via
+# _submit see the cache of the submitting context only, other threads never do.
+_run_cache: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar("_run_cache", default=None)
+
+
+@contextmanager
+def _caching() -> Iterator[None]:
+    """Enable the run cache used by _cached for the duration of the block.
+
+    The cache is bound to the current context and discarded once the
+    outermost block exits, so results never outlive a run, are never
+    seen by concurrent runs and changes to a pipeline between runs are
+    picked up.
+    """
+    if _run_cache.get() is not None:
+        yield
+        return
+    token = _run_cache.set({})
+    try:
+        yield
+    finally:
+        _run_cache.reset(token)
+
+
+def _submit(executor: Executor, fn: Callable[..., T], *args: Any) -> "Future[T]":
+    """Submit fn to executor, running it in a copy of the current context.
+
+    This makes the run cache of the caller available to the worker thread.
+
+    :param executor: executor to submit to
+    :type executor: concurrent.futures.Executor
+    :param fn: function to call
+    :type fn: Callable[..., T]
+    :param args: positional arguments passed to fn
+    :type args: Any
+    :return: future of the result of fn
+    :rtype: concurrent.futures.Future
+    """
+    return executor.submit(copy_context().run, fn, *args)
+
+
+def _map(executor: Executor, fn: Callable[..., T], *iterables: Iterable[Any]) -> List[T]:
+    """Like Executor.map, but running fn in a copy of the current context.
+
+    :param executor: executor to submit to
+    :type executor: concurrent.futures.Executor
+    :param fn: function to call
+    :type fn: Callable[..., T]
+    :param iterables: iterables of positional arguments passed to fn
+    :type iterables: Iterable[Any]
+    :return: results of fn, in the order of the arguments
+    :rtype: List[T]
+    """
+    futures = [_submit(executor, fn, *args) for args in zip(*iterables)]
+    return [future.result() for future in futures]
+
+
+def _cached(key: Hashable, compute: Callable[[], T]) -> T:
+    """Return the cached value for key, computing it if necessary.
+
+    Values are only cached inside a _caching block, otherwise compute
+    is called every time.
+
+    :param key: cache key
+    :type key: Hashable
+    :param compute: function computing the value
+    :type compute: Callable[[], T]
+    :return: cached or computed value
+    :rtype: T
+    """
+    cache = _run_cache.get()
+    if cache is None:
+        return compute()
+    try:
+        return cache[key]
+    except KeyError:
+        value = cache[key] = compute()
+        return value
+
+
+@lru_cache(maxsize=None)
+def _parse_conditions(path: str) -> Tuple[Tuple[Callable[[object], Any], str], ...]:
+    """Parse the filter conditions of a path into (getter, value) pairs.
+
+    :param path: path containing a filter, e.g. "steps[name==foo && step_type/value==Training]"
+    :type path: str
+    :return: filter conditions as (attrgetter of the key, expected value) pairs
+    :rtype: Tuple[Tuple[Callable[[object], Any], str], ...]
+    """
+    filter_conditions = _FILTER_RE.search(path).group(1).replace(" ", "").split("&&")
+    parsed_conditions = []
+    for condition in filter_conditions:
+        if condition:
+            filter_key, filter_value = condition.replace("/", ".").split("==")
+            parsed_conditions.append((attrgetter(filter_key), filter_value))
+    return tuple(parsed_conditions)
+
+
+@lru_cache(maxsize=None)
+def _compile_path(path: str) -> Tuple[Tuple[str, str], ...]:
+    """Compile a path into the sequence of traversal operations it describes.
+
+    Operations are ("attr", name) to get an attribute of the current
+    object, ("filter", segment) to filter the current objects by the
+    conditions in segment and ("map", name) to get an attribute of each
+    of the current objects.
+
+    :param path: path to the attribute, e.g. ".steps[name==foo].processor.image_uri"
+    :type path: str
+    :raises ValueError: If path is malformed.
+    :return: traversal operations
+    :rtype: Tuple[Tuple[str, str], ...]
+    """
+    root, *attrs = path.split(".")
+    if root or not attrs or not all(_PATH_SEGMENT_RE.match(attr) for attr in attrs):
+        raise ValueError(f"Path {path} is malformed.")
+    operations = []
+    for attr in attrs:
+        if attr.endswith("]"):
+            operations.append(("attr", attr.split("[")[0]))
+            if attr[-2] != "[":
+                operations.append(("filter", attr))
+        else:
+            operations.append(("map", attr))
+    return tuple(operations)
+
 
 @dataclass
 class ValidationResult:
     """Validation result dataclass."""
 
+    __slots__ = ("validation_name", "success", "negative", "message", "subject")
+
     validation_name: str
     success: bool
     negative: bool
@@ -21,6 +171,10 @@ class ValidationResult:
     subject: str
 
 
+_VALIDATION_RESULT_COLUMNS = tuple(ValidationResult.__annotations__)
+_validation_result_row = attrgetter(*_VALIDATION_RESULT_COLUMNS)
+
+
 class Rule(ABC):
     """Rule abstract base class."""
 
@@ -67,12 +221,16 @@ class Validation(ABC):
         :type name: str
         :param rule: rule to be applied to the validation, defaults to None
         :type rule: Optional[Rule]
+        :raises ValueError: If any path is malformed.
         :return:
         :rtype:
         """
         self.paths: List[Optional[str]] = paths if paths else []
         self.name: str = name
         self.rule: Rule = rule
+        # Surface malformed paths on construction rather than on the first run
+        for path in self.paths:
+            _ = _compile_path(path)
 
     @staticmethod
     def get_filtered_attributes(filter_subject: Iterable[object], path: str) -> List[object]:
@@ -87,21 +245,9 @@ class Validation(ABC):
         """
         # TODO: refactor
         filtered_steps = []
-        filter_conditions = (
-            re.search("\[(.*?)\]", path).group(1).replace(" ", "").split("&&")  # noqa: W605
-        )
-        filter_conditions = [
-            condition.replace("/", ".") for condition in filter_conditions if condition
-        ]
+        filter_conditions = _parse_conditions(path)
         for subject in filter_subject:
-            match = []
-            for condition in filter_conditions:
-                filter_key, filter_value = condition.split("==")
-                if attrgetter(filter_key)(subject) != filter_value:
-                    match.append(False)
-                    continue
-                match.append(True)
-            if all(match):
+            if all(getter(subject) == filter_value for getter, filter_value in filter_conditions):
                 filtered_steps.append(subject)
         return filtered_steps
 
@@ -119,28 +265,43 @@ class Validation(ABC):
         :return: attribute
         :rtype: List
         """
-        # TODO: refactor
         result = []
         for path in paths:
-            attr_path = path.split(".")[1:]
-            sm_pipeline_copy = copy(sagemaker_pipeline)
-            for ix, attr in enumerate(attr_path):
-                if attr.endswith("]"):
-                    has_filter_dict = attr[-2] != "["
-                    raw_attr = attr.split("[")[0]
-                    sm_pipeline_copy = getattr(sm_pipeline_copy, raw_attr)
-                    if has_filter_dict:
-                        sm_pipeline_copy = Validation.get_filtered_attributes(
-                            sm_pipeline_copy, ".".join(attr_path[ix:])
-                        )
-                else:
-                    sm_pipeline_copy = [
-                        getattr(sub_attr, attr)
-                        for sub_attr in sm_pipeline_copy
-                        if hasattr(sub_attr, attr)
-                    ]
-            result.append(sm_pipeline_copy)
-        return [x for y in result for x in y]
+            # Validations often share paths, so traverse each one only once per run
+            result.append(
+                _cached(
+                    ("attribute", id(sagemaker_pipeline), path),
+                    partial(Validation._get_path_attribute, sagemaker_pipeline, path),
+                )
+            )
+        return list(chain.from_iterable(result))
+
+    @staticmethod
+    def _get_path_attribute(sagemaker_pipeline: Pipeline, path: str) -> List:
+        """Get attribute of a single path from pipeline.
+
+        :param sagemaker_pipeline: sagemaker pipeline
+        :type sagemaker_pipeline: sagemaker.workflow.pipeline.Pipeline
+        :param path: path to the attribute
+        :type path: str
+        :return: attribute
+        :rtype: List
+        """
+        # Bound locally as it is looked up for every traversed object
+        _getattr = getattr
+        current = sagemaker_pipeline
+        for operation, arg in _compile_path(path):
+            if operation == "attr":
+                current = _getattr(current, arg)
+            elif operation == "filter":
+                current = Validation.get_filtered_attributes(current, arg)
+            else:
+                current = [
+                    value
+                    for value in (_getattr(sub_attr, arg, _MISSING) for sub_attr in current)
+                    if value is not _MISSING
+                ]
+        return current
 
     @abstractmethod
     def run(
@@ -171,8 +332,8 @@ class Report:
         :rtype: pd.DataFrame
         """
         df = pd.DataFrame.from_records(
-            data=[x.__dict__ for x in self.results],
-            columns=ValidationResult.__annotations__.keys(),
+            data=[_validation_result_row(x) for x in self.results],
+            columns=_VALIDATION_RESULT_COLUMNS,
         )
         return df.reset_index(drop=True)
 
@@ -189,7 +350,7 @@ class ValidationFailedError(Exception):
         :rtype: None
         """
         self.validation_result = validation_result
-        self.message = f"Validation failed: {validation_result.__dict__}"
+        self.message = f"Validation failed: {asdict(validation_result)}"
         super().__init__(self.message)
 
 
@@ -280,26 +441,69 @@ class Configuration:
             )
         return result
 
-    def run(self, fail_fast: bool = False, return_df: bool = False) -> Union[Report, dict]:
+    def _run_validation(self, validation: Validation) -> ValidationResult:
+        """Run a single validation on the pipeline.
+
+        :param validation: Validation object.
+        :type validation: Validation
+        :return: validation result.
+        :rtype: ValidationResult
+        """
+        result = validation.run(self.sagemaker_pipeline)
+        return Configuration._handle_empty_results(result, validation)
+
+    def run(
+        self, fail_fast: bool = False, return_df: bool = False, max_workers: Optional[int] = None
+    ) -> Union[Report, dict]:
         """Run all validations and return a report.
 
         :param fail_fast: If True, stop validation after the first failure.
         :type fail_fast: bool
         :param return_df: If True, return a pandas dataframe instead of a Report object.
         :type return_df: bool
+        :param max_workers: If set and fail_fast is False, run validations concurrently in a
+            thread pool of this size (default: None, i.e. run sequentially). Validations
+            created with a service name share one boto3 client per service, whose connection
+            pool holds 10 connections. Concurrent requests beyond that still succeed, but
+            connections are not reused.
+        :type max_workers: Optional[int]
         :raises ValidationFailedError: If fail_fast is True and a validation fails.
         :return: Report object or pandas dataframe.
         :rtype: Report or dict
         """
+        with _caching():
+            results = self._run_validations(fail_fast, max_workers)
+        return self._make_report(results, return_df)
+
+    def _run_validations(
+        self, fail_fast: bool, max_workers: Optional[int]
+    ) -> List[ValidationResult]:
+        """Run all validations and return their results.
+
+        :param fail_fast: If True, stop validation after the first failure.
+        :type fail_fast: bool
+        :param max_workers: If set and fail_fast is False, run validations concurrently in a
+            thread pool of this size.
+        :type max_workers: Optional[int]
+        :raises ValidationFailedError: If fail_fast is True and a validation fails.
+        :return: List of results.
+        :rtype: List[ValidationResult]
+        """
+        if max_workers and not fail_fast:
+            # Validations only read the pipeline, so they can run independently. The order
+            # of the results is preserved by _map.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return _map(executor, self._run_validation, self.validations)
+
         results = []
+        last_ix = len(self.validations) - 1
         for ix, validation in enumerate(self.validations):
-            result = validation.run(self.sagemaker_pipeline)
-            result = Configuration._handle_empty_results(result, validation)
+            result = self._run_validation(validation)
             results.append(result)
-            if not result.success and fail_fast and not (ix == len(self.validations) - 1):
+            if not result.success and fail_fast and ix != last_ix:
                 logging.info(
                     "Validation failed and fail_fast is set to True. Stopping validation "
                     "prematurely."
                 )
                 raise ValidationFailedError(result)
-        return self._make_report(results, return_df)
+        return results
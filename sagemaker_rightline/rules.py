@@ -38,24 +38,26 @@ class Equals(Rule):
                 # In case of dict
                 is_equal = observed == expected
             else:
-                # In case of int, float, str
-                is_equal = set(observed) == set(expected)
+                # In case of int, float, str; only compare as sets if the lists differ
+                is_equal = observed == expected or set(observed) == set(expected)
         except TypeError:
             # In case of nested list
             if isinstance(observed, list) and isinstance(expected, list):
-                is_equal = all(True if item in observed else False for item in expected) and all(
-                    True if item in expected else False for item in observed
+                is_equal = all(item in observed for item in expected) and all(
+                    item in expected for item in observed
                 )
             else:
                 is_equal = observed == expected
 
         is_equal = is_equal if not self.negative else not is_equal
+        # Formatting large lists is not free, so format expected only once
+        expected_str = str(expected)
         return ValidationResult(
             validation_name=validation_name,
             success=is_equal,
             negative=self.negative,
-            message=f"{str(observed)} does {'not ' if not is_equal else ''}equal {str(expected)}",
-            subject=str(expected),
+            message=f"{observed} does {'not ' if not is_equal else ''}equal {expected_str}",
+            subject=expected_str,
         )
 
 
@@ -86,13 +88,18 @@ class Contains(Rule):
         :return: validation result
         :rtype: ValidationResult
         """
-        is_contained = all(item in observed for item in expected)
+        try:
+            observed_set = set(observed)
+            is_contained = all(item in observed_set for item in expected)
+        except TypeError:
+            # In case of unhashable items, e.g. dicts
+            is_contained = all(item in observed for item in expected)
         is_contained = is_contained if not self.negative else not is_contained
+        expected_str = str(expected)
         return ValidationResult(
             validation_name=validation_name,
             success=is_contained,
             negative=self.negative,
-            message=f"{str(observed)} does {'not ' if not is_contained else ''}contain "
-            f"{str(expected)}",
-            subject=str(expected),
+            message=f"{observed} does {'not ' if not is_contained else ''}contain {expected_str}",
+            subject=expected_str,
         )
@@ -1,8 +1,13 @@
+import copy
 import re
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from sagemaker.estimator import Estimator
 from sagemaker.inputs import FileSystemInput, TrainingInput, TransformInput
@@ -10,10 +15,83 @@ from sagemaker.processing import NetworkConfig, ProcessingInput, ProcessingOutpu
 from sagemaker.workflow.entities import PipelineVariable
 from sagemaker.workflow.parameters import Parameter
 from sagemaker.workflow.pipeline import Pipeline
-
-from sagemaker_rightline.model import Rule, Validation, ValidationResult
+from sagemaker.workflow.steps import StepTypeEnum
+
+from sagemaker_rightline.model import (
+    Rule,
+    Validation,
+    ValidationResult,
+    _cached,
+    _map,
+    _run_cache,
+    _submit,
+)
 from sagemaker_rightline.rules import Equals
 
+# <account_id>.dkr.ecr.<region>.<domain>/<repository>:<tag>
+_ECR_IMAGE_URI_RE = re.compile(r"^([^.]+)\.dkr\.ecr\.([^.]+)\.[^/]+/(.+):([^:]+)$")
+_NETWORK_CONFIG_ATTRS = tuple(vars(NetworkConfig()))
+# Maximum number of concurrent AWS requests issued by a single Validation
+_MAX_WORKERS = 10
+# Connection pool sized for the concurrent requests of one Validation. Validations run
+# concurrently by Configuration.run share the pool of their default client, so beyond
+# _MAX_WORKERS concurrent requests urllib3 discards surplus connections after use.
+# Adaptive retries absorb throttling caused by concurrent requests.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=_MAX_WORKERS,
+    retries={"mode": "adaptive", "max_attempts": 8},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+
+def _default_client(service_name: str) -> "boto3.client":
+    """Get a boto3 client for a service, shared by all Validations.
+
+    Creating a client loads the service model and resolves credentials,
+    so Validations configured by service name reuse one client. Like
+    boto3.client, the client is created from the default session and
+    region, a new client is created when either of them changes.
+
+    :param service_name: Name of the AWS service
+    :type service_name: str
+    :return: boto3 client
+    :rtype: boto3.client
+    """
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    session = boto3.DEFAULT_SESSION
+    return _session_client(session, service_name, session.region_name)
+
+
+@lru_cache(maxsize=32)
+def _session_client(
+    session: boto3.Session, service_name: str, region_name: Optional[str]
+) -> "boto3.client":
+    """Get a boto3 client for a service of a session and region.
+
+    :param session: boto3 session creating the client
+    :type session: boto3.Session
+    :param service_name: Name of the AWS service
+    :type service_name: str
+    :param region_name: Name of the AWS region
+    :type region_name: Optional[str]
+    :return: boto3 client
+    :rtype: boto3.client
+    """
+    return session.client(service_name, region_name=region_name, config=_CLIENT_CONFIG)
+
+
+def _role_name(role_arn: str) -> str:
+    """Get the name of an IAM Role from its ARN.
+
+    :param role_arn: ARN of the IAM Role, e.g. "arn:aws:iam::123456789012:role/path/name"
+    :type role_arn: str
+    :return: name of the IAM Role
+    :rtype: str
+    """
+    return role_arn.rpartition("/")[2]
+
 
 class PipelineParametersAsExpected(Validation):
     """Validate Pipeline Parameters.
@@ -32,6 +110,19 @@ class PipelineParametersAsExpected(Validation):
         self.parameters_expected: List[Parameter] = parameters_expected
         self.ignore_default_value: bool = ignore_default_value
 
+    @staticmethod
+    def _without_default_value(parameter: Parameter) -> Parameter:
+        """Return a shallow copy of a Parameter with its default value unset.
+
+        :param parameter: Parameter to copy
+        :type parameter: Parameter
+        :return: copy of parameter without default value
+        :rtype: Parameter
+        """
+        parameter = copy.copy(parameter)
+        parameter.default_value = None
+        return parameter
+
     def run(self, sagemaker_pipeline: Pipeline) -> ValidationResult:
         """Runs validation of Parameters on Pipeline.
 
@@ -42,8 +133,10 @@ class PipelineParametersAsExpected(Validation):
         """
         parameters_observed = Validation.get_attribute(sagemaker_pipeline, self.paths)
         if self.ignore_default_value:
-            for ix, parameter in enumerate(parameters_observed):
-                parameters_observed[ix].default_value = None
+            parameters_observed = [
+                PipelineParametersAsExpected._without_default_value(parameter)
+                for parameter in parameters_observed
+            ]
         result = self.rule.run(parameters_observed, self.parameters_expected, self.name)
         return result
 
@@ -91,26 +184,124 @@ class StepKmsKeyIdAsExpected(Validation):
         return result
 
 
-@dataclass
+@dataclass(frozen=True)
 class ContainerImage:
     """Container Image dataclass."""
 
+    __slots__ = ("uri", "account_id", "repository", "region", "tag")
+
     uri: str
 
     def __post_init__(self) -> None:
-        """Decompose ImageUri into its components."""
-        self.account_id = self.uri.split(".")[0]
-        self.repository = re.search("/(.*):", self.uri).group(1)
-        self.region = self.uri.split(".")[3]
-        self.tag = self.uri.split(":")[1]
+        """Decompose ImageUri into its components.
+
+        :raises ValueError: If uri is not an ECR image URI.
+        """
+        match = _ECR_IMAGE_URI_RE.match(self.uri)
+        if not match:
+            raise ValueError(f"{self.uri} is not a valid ECR image URI.")
+        for name, value in zip(("account_id", "region", "repository", "tag"), match.groups()):
+            object.__setattr__(self, name, value)
 
+    def __getstate__(self) -> Dict[str, str]:
+        """Get the state of the ContainerImage for copy and pickle.
 
-class StepImagesExist(Validation):
+        :return: attribute values keyed by name
+        :rtype: Dict[str, str]
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, str]) -> None:
+        """Restore the state of the ContainerImage, bypassing frozen assignment.
+
+        :param state: attribute values keyed by name
+        :type state: Dict[str, str]
+        :return: None
+        :rtype: None
+        """
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+@lru_cache(maxsize=512)
+def _parse_image(uri: str) -> ContainerImage:
+    """Get the ContainerImage of an image URI, parsing each URI only once.
+
+    :param uri: ECR image URI
+    :type uri: str
+    :raises ValueError: If uri is not an ECR image URI.
+    :return: parsed image URI
+    :rtype: ContainerImage
+    """
+    return ContainerImage(uri=uri)
+
+
+class _ResourcesExist(Validation):
+    """Base class of Validations checking whether AWS resources referenced in a Pipeline exist."""
+
+    # Maximum number of concurrent AWS requests
+    MAX_WORKERS = _MAX_WORKERS
+
+    def _partition_existing(
+        self, items: List[str], cache_prefix: str, check: Callable[[str], bool]
+    ) -> Tuple[List[str], List[str]]:
+        """Split items into those that exist and those that do not.
+
+        Items are checked concurrently and each check is cached for the
+        duration of a run.
+
+        :param items: distinct items to check
+        :type items: List[str]
+        :param cache_prefix: prefix of the run cache key of each check
+        :type cache_prefix: str
+        :param check: function returning whether an item exists
+        :type check: Callable[[str], bool]
+        :return: items that exist, items that do not exist
+        :rtype: Tuple[List[str], List[str]]
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
+            items_exist = _map(
+                executor,
+                _cached,
+                [(cache_prefix, id(self.client), item) for item in items],
+                [partial(check, item) for item in items],
+            )
+        exist = []
+        not_exist = []
+        for item, item_exists in zip(items, items_exist):
+            if item_exists:
+                exist.append(item)
+            else:
+                not_exist.append(item)
+        return exist, not_exist
+
+    def _max_workers(self) -> int:
+        """Get the number of concurrent requests, bounded by the connection pool of the client.
+
+        Clients without a botocore connection pool are bounded by MAX_WORKERS only.
+
+        :return: number of concurrent requests
+        :rtype: int
+        """
+        max_pool_connections = getattr(
+            getattr(getattr(self.client, "meta", None), "config", None),
+            "max_pool_connections",
+            None,
+        )
+        if not isinstance(max_pool_connections, int):
+            return self.MAX_WORKERS
+        return min(self.MAX_WORKERS, max_pool_connections)
+
+
+class StepImagesExist(_ResourcesExist):
     """Check if container images exist in ECR.
 
     Supported only for ProcessingStep and TrainingStep.
     """
 
+    # Maximum number of imageIds accepted by a single ECR DescribeImages request
+    MAX_IMAGE_IDS = 100
+
     def __init__(
         self,
         boto3_client: Union["boto3.client('ecr')", str] = "ecr",  # noqa F821
@@ -137,9 +328,96 @@ class StepImagesExist(Validation):
             raise ValueError(f"boto3_client must be 'ecr', not {boto3_client}.")
         if boto3_client:
             self.client = (
-                boto3_client if not isinstance(boto3_client, str) else boto3.client(boto3_client)
+                boto3_client if not isinstance(boto3_client, str) else _default_client(boto3_client)
             )
 
+    def _describe_tags(
+        self, account_id: str, repository: str, tags: Tuple[str, ...]
+    ) -> Optional[Set[str]]:
+        """Get the subset of tags that exist in an ECR repository with a single request.
+
+        :param account_id: AWS account id of the registry
+        :type account_id: str
+        :param repository: name of the ECR repository
+        :type repository: str
+        :param tags: image tags to look up, at most MAX_IMAGE_IDS
+        :type tags: Tuple[str, ...]
+        :return: tags that exist in the repository, None if ECR failed the request
+            because one of several tags does not exist
+        :rtype: Optional[Set[str]]
+        """
+        try:
+            response = self.client.describe_images(
+                registryId=account_id,
+                repositoryName=repository,
+                imageIds=[{"imageTag": tag} for tag in tags],
+            )
+        except ClientError as error:
+            if len(tags) > 1 and error.response["Error"]["Code"] == "ImageNotFoundException":
+                return None
+            return set()
+        return {
+            tag for image in response["imageDetails"] for tag in image.get("imageTags", [])
+        }.intersection(tags)
+
+    def _get_existing_images(
+        self, executor: Executor, tags_by_repository: Dict[Tuple[str, str], List[str]]
+    ) -> Set[Tuple[str, str, str]]:
+        """Get the images that exist in ECR.
+
+        Whether an image exists is cached per image for the duration of a
+        run, so only images not looked up before in the run are requested.
+        Tags are looked up concurrently in batches of at most MAX_IMAGE_IDS
+        per request. If a batch contains a missing tag, ECR fails the whole
+        request, in which case both halves of the batch are looked up.
+
+        :param executor: executor to run the requests in
+        :type executor: concurrent.futures.Executor
+        :param tags_by_repository: image tags to look up, keyed by (account_id, repository)
+        :type tags_by_repository: Dict[Tuple[str, str], List[str]]
+        :return: (account_id, repository, tag) of each image that exists
+        :rtype: Set[Tuple[str, str, str]]
+        """
+        # Outside of a run, results only need to live as long as this call
+        cache = _run_cache.get()
+        if cache is None:
+            cache = {}
+        batches = {}
+
+        def submit(account_id: str, repository: str, tags: Tuple[str, ...]) -> None:
+            future = _submit(executor, self._describe_tags, account_id, repository, tags)
+            batches[future] = (account_id, repository, tags)
+
+        existing_images = set()
+        for (account_id, repository), tags in tags_by_repository.items():
+            uncached_tags = []
+            for tag in tags:
+                image_exists = cache.get(("ecr", id(self.client), account_id, repository, tag))
+                if image_exists is None:
+                    uncached_tags.append(tag)
+                elif image_exists:
+                    existing_images.add((account_id, repository, tag))
+            for start in range(0, len(uncached_tags), self.MAX_IMAGE_IDS):
+                end = start + self.MAX_IMAGE_IDS
+                submit(account_id, repository, tuple(uncached_tags[start:end]))
+
+        while batches:
+            done, _ = wait(batches, return_when=FIRST_COMPLETED)
+            for future in done:
+                account_id, repository, tags = batches.pop(future)
+                existing_tags = future.result()
+                if existing_tags is None:
+                    middle = len(tags) // 2
+                    submit(account_id, repository, tags[:middle])
+                    submit(account_id, repository, tags[middle:])
+                    continue
+                for tag in tags:
+                    image_exists = tag in existing_tags
+                    cache[("ecr", id(self.client), account_id, repository, tag)] = image_exists
+                    if image_exists:
+                        existing_images.add((account_id, repository, tag))
+        return existing_images
+
     def run(
         self,
         sagemaker_pipeline: Pipeline,
@@ -152,25 +430,35 @@ class StepImagesExist(Validation):
         :return: validation result
         :rtype: ValidationResult
         """
-        paginator = self.client.get_paginator("describe_images")
+        # The same image is commonly referenced by several steps
+        uris = list(dict.fromkeys(Validation.get_attribute(sagemaker_pipeline, self.paths)))
+        if not uris:
+            return ValidationResult(
+                validation_name=self.name,
+                success=True,
+                negative=False,
+                message="Images [] exist.",
+                subject="[]",
+            )
+        container_images = [_parse_image(uri) for uri in uris]
+
+        # One request per repository instead of one per image
+        tags_by_repository = defaultdict(list)
+        for container_image in container_images:
+            key = (container_image.account_id, container_image.repository)
+            if container_image.tag not in tags_by_repository[key]:
+                tags_by_repository[key].append(container_image.tag)
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
+            existing_images = self._get_existing_images(executor, tags_by_repository)
 
-        uris = Validation.get_attribute(sagemaker_pipeline, self.paths)
-        # return uris
         not_exist = []
         exist = []
-        for uri in uris:
-            container_image = ContainerImage(uri=uri)
-            try:
-                _ = list(
-                    paginator.paginate(
-                        repositoryName=container_image.repository,
-                        registryId=container_image.account_id,
-                        imageIds=[{"imageTag": container_image.tag}],
-                    )
-                )
-                exist.append(uri)
-            except ClientError:
-                not_exist.append(uri)
+        for container_image in container_images:
+            image = (container_image.account_id, container_image.repository, container_image.tag)
+            if image in existing_images:
+                exist.append(container_image.uri)
+            else:
+                not_exist.append(container_image.uri)
         if not_exist:
             return ValidationResult(
                 validation_name=self.name,
@@ -219,6 +507,24 @@ class StepNetworkConfigAsExpected(Validation):
             rule=rule,
         )
         self.network_config_expected: NetworkConfig = network_config_expected
+        self.step_name: Optional[str] = step_name
+
+    @staticmethod
+    def _get_network_config_dict(training_step_estimator: Estimator) -> Dict[str, Any]:
+        """Get the NetworkConfig attributes of a training step estimator.
+
+        :param training_step_estimator: Training step estimator
+        :type training_step_estimator: Estimator
+        :return: NetworkConfig attributes of the estimator
+        :rtype: Dict[str, Any]
+        """
+        network_config_dict = {}
+        for attr_name in _NETWORK_CONFIG_ATTRS:
+            attr_value = getattr(training_step_estimator, attr_name)
+            # Some attributes of NetworkConfig are callable and return the value,
+            # so we need to call them
+            network_config_dict[attr_name] = attr_value() if callable(attr_value) else attr_value
+        return network_config_dict
 
     @staticmethod
     def get_training_step_network_config(
@@ -231,21 +537,29 @@ class StepNetworkConfigAsExpected(Validation):
         :return: List of NetworkConfig of each training step estimator
         :rtype: List[NetworkConfig]
         """
-        default_network_config = NetworkConfig()
-        training_step_network_configs = []
-        for step in training_step_estimators:
-            step_dict = {}
-            for attr_name in default_network_config.__dict__.keys():
-                attr_value = getattr(step, attr_name)
-                # Some attributes of NetworkConfig are callable and return the value,
-                # so we need to call them
-                step_dict[attr_name] = (
-                    attr_value
-                    if any([isinstance(attr_value, bool), isinstance(attr_value, list)])
-                    else attr_value()
-                )
-            training_step_network_configs.append(NetworkConfig(**step_dict))
-        return training_step_network_configs
+        return [
+            NetworkConfig(**StepNetworkConfigAsExpected._get_network_config_dict(step))
+            for step in training_step_estimators
+        ]
+
+    @staticmethod
+    def _get_training_step_network_configs(
+        sagemaker_pipeline: Pipeline,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get NetworkConfig attributes of each TrainingStep in Pipeline, keyed by step name.
+
+        TrainingSteps defined via step_args carry no estimator and are skipped.
+
+        :param sagemaker_pipeline: SageMaker Pipeline
+        :type sagemaker_pipeline: sagemaker.workflow.pipeline.Pipeline
+        :return: NetworkConfig attributes of each TrainingStep, keyed by step name
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        return {
+            step.name: StepNetworkConfigAsExpected._get_network_config_dict(step.estimator)
+            for step in sagemaker_pipeline.steps
+            if step.step_type is StepTypeEnum.TRAINING and step.estimator is not None
+        }
 
     def run(
         self,
@@ -259,28 +573,23 @@ class StepNetworkConfigAsExpected(Validation):
         :rtype: ValidationResult
         """
         network_configs_observed = Validation.get_attribute(sagemaker_pipeline, self.paths)
+        network_configs_observed_dict = [
+            nwc.__dict__ if nwc else None for nwc in network_configs_observed
+        ]
 
         # Compatibility with TrainingStep, which does not have a NetworkConfig object
         # as attribute, but takes the attributes of NetworkConfig as individual arguments.
-        training_step_estimators = [
-            step.estimator
-            for step in sagemaker_pipeline.steps
-            if step.step_type.value == "Training"
-            and step.name == self.step_filter.replace("name==", "")
-        ]
-        if training_step_estimators:
-            network_configs_observed += (
-                StepNetworkConfigAsExpected.get_training_step_network_config(
-                    training_step_estimators
-                )
+        if self.step_name is not None:
+            training_step_network_configs = _cached(
+                ("training_step_network_configs", id(sagemaker_pipeline)),
+                partial(
+                    StepNetworkConfigAsExpected._get_training_step_network_configs,
+                    sagemaker_pipeline,
+                ),
             )
+            if self.step_name in training_step_network_configs:
+                network_configs_observed_dict.append(training_step_network_configs[self.step_name])
 
-        network_configs_observed_dict = []
-        for nwc in network_configs_observed:
-            if nwc:
-                network_configs_observed_dict.append(nwc.__dict__)
-            else:
-                network_configs_observed_dict.append(None)
         network_config_expected_dict = (
             self.network_config_expected.__dict__
             if self.network_config_expected
@@ -292,7 +601,7 @@ class StepNetworkConfigAsExpected(Validation):
         return result
 
 
-class StepLambdaFunctionExists(Validation):
+class StepLambdaFunctionExists(_ResourcesExist):
     """Validate whether Lambda Function referenced in LambdaSteps exists."""
 
     def __init__(
@@ -312,7 +621,7 @@ class StepLambdaFunctionExists(Validation):
             raise ValueError(f"boto3_client must be 'lambda', not {boto3_client}.")
         if boto3_client:
             self.client = (
-                boto3_client if not isinstance(boto3_client, str) else boto3.client(boto3_client)
+                boto3_client if not isinstance(boto3_client, str) else _default_client(boto3_client)
             )
 
         super().__init__(
@@ -322,6 +631,22 @@ class StepLambdaFunctionExists(Validation):
             ],
         )
 
+    def function_exists(self, function_name: str) -> bool:
+        """Check whether a Lambda Function exists.
+
+        :param function_name: Name or ARN of the Lambda Function
+        :type function_name: str
+        :return: True if the Lambda Function exists, False otherwise
+        :rtype: bool
+        """
+        try:
+            _ = self.client.get_function(
+                FunctionName=function_name,
+            )
+        except ClientError:
+            return False
+        return True
+
     def run(
         self,
         sagemaker_pipeline: Pipeline,
@@ -333,22 +658,18 @@ class StepLambdaFunctionExists(Validation):
         :return: validation result
         :rtype: ValidationResult
         """
-        lambda_func_observed = Validation.get_attribute(sagemaker_pipeline, self.paths)
-        exist = []
-        not_exist = []
-        for func in lambda_func_observed:
-            try:
-                _ = self.client.get_function(
-                    FunctionName=func,
-                )
-                exist.append(func)
-            except ClientError:
-                not_exist.append(func)
+        # Several LambdaSteps may invoke the same Lambda Function, look each one up only once
+        lambda_func_observed = list(
+            dict.fromkeys(Validation.get_attribute(sagemaker_pipeline, self.paths))
+        )
+        exist, not_exist = self._partition_existing(
+            lambda_func_observed, "lambda_function", self.function_exists
+        )
         if not_exist:
             return ValidationResult(
                 success=False,
                 negative=False,
-                message=f"Lambda Function {not_exist} does not " f"exist.",
+                message=f"Lambda Function {not_exist} does not exist.",
                 subject=str(lambda_func_observed),
                 validation_name=self.name,
             )
@@ -411,12 +732,12 @@ class StepRoleNameAsExpected(Validation):
         :rtype: ValidationResult
         """
         role_arns_observed = Validation.get_attribute(sagemaker_pipeline, self.paths)
-        role_name_observed = [role_arn.split("/")[-1] for role_arn in role_arns_observed]
+        role_name_observed = [_role_name(role_arn) for role_arn in role_arns_observed]
         result = self.rule.run(role_name_observed, [self.role_name_expected], self.name)
         return result
 
 
-class StepRoleNameExists(Validation):
+class StepRoleNameExists(_ResourcesExist):
     """Validate existence of Role of Pipeline Step.
 
     Supported only for ProcessingStep and TrainingStep. This validation
@@ -443,7 +764,7 @@ class StepRoleNameExists(Validation):
             raise ValueError(f"boto3_client must be 'iam', not {boto3_client}.")
         if boto3_client:
             self.client = (
-                boto3_client if not isinstance(boto3_client, str) else boto3.client(boto3_client)
+                boto3_client if not isinstance(boto3_client, str) else _default_client(boto3_client)
             )
 
         super().__init__(
@@ -454,6 +775,22 @@ class StepRoleNameExists(Validation):
             ],
         )
 
+    def role_exists(self, role_name: str) -> bool:
+        """Check whether an IAM Role exists.
+
+        :param role_name: Name of the IAM Role
+        :type role_name: str
+        :return: True if the IAM Role exists, False otherwise
+        :rtype: bool
+        """
+        try:
+            _ = self.client.get_role(
+                RoleName=role_name,
+            )
+        except ClientError:
+            return False
+        return True
+
     def run(
         self,
         sagemaker_pipeline: Pipeline,
@@ -466,18 +803,13 @@ class StepRoleNameExists(Validation):
         :rtype: ValidationResult
         """
         role_arns_observed = Validation.get_attribute(sagemaker_pipeline, self.paths)
-        role_name_observed = [role_arn.split("/")[-1] for role_arn in role_arns_observed]
-
-        exist = []
-        not_exist = []
-        for role_name in role_name_observed:
-            try:
-                _ = self.client.get_role(
-                    RoleName=role_name,
-                )
-                exist.append(role_name)
-            except ClientError:
-                not_exist.append(role_name)
+        # Steps commonly share a Role, look each one up only once
+        role_name_observed = list(
+            dict.fromkeys(_role_name(role_arn) for role_arn in role_arns_observed)
+        )
+        exist, not_exist = self._partition_existing(
+            role_name_observed, "iam_role", self.role_exists
+        )
         if not_exist:
             return ValidationResult(
                 success=False,
@@ -608,6 +940,11 @@ class StepInputsAsExpected(Validation):
         self.inputs_expected: List[
             Dict[str, Union[str, TrainingInput, ProcessingInput, FileSystemInput]]
         ] = inputs_expected
+        # Expected Inputs formatted per step_type_filter, the Step type of a named Step is only
+        # known when running
+        self.inputs_expected_formatted: Dict[str, List[Union[dict, str]]] = {}
+        if self.step_type_filter:
+            _ = self.get_inputs_expected_formatted(self.step_type_filter)
 
     @staticmethod
     def format_training_inputs(
@@ -626,12 +963,30 @@ class StepInputsAsExpected(Validation):
                 formatted_inputs.append(
                     {
                         key: value.__dict__
-                        if isinstance(value, TrainingInput) or isinstance(value, FileSystemInput)
+                        if isinstance(value, (TrainingInput, FileSystemInput))
                         else value
                     }
                 )
         return formatted_inputs
 
+    def get_inputs_expected_formatted(self, step_type_filter: str) -> List[Union[dict, str]]:
+        """Get expected Inputs formatted for a Step type, formatting them only once.
+
+        :param step_type_filter: Step type filter, e.g. "step_type/value==Training"
+        :type step_type_filter: str
+        :return: Formatted expected Inputs
+        :rtype: List[Union[dict, str]]
+        """
+        if step_type_filter not in self.inputs_expected_formatted:
+            if step_type_filter == "step_type/value==Training":
+                inputs_expected_formatted = StepInputsAsExpected.format_training_inputs(
+                    self.inputs_expected
+                )
+            else:
+                inputs_expected_formatted = [x.__dict__ for x in self.inputs_expected]
+            self.inputs_expected_formatted[step_type_filter] = inputs_expected_formatted
+        return self.inputs_expected_formatted[step_type_filter]
+
     def run(
         self,
         sagemaker_pipeline: Pipeline,
@@ -654,17 +1009,13 @@ class StepInputsAsExpected(Validation):
         if self.step_type_filter == "step_type/value==Processing":
             # ProcessingStep/TransformStep has a list of ProcessingInput/TransformInput
             inputs_observed_formatted = [x.__dict__ for y in inputs_observed for x in y]
-            inputs_expected_formatted = [x.__dict__ for x in self.inputs_expected]
         elif self.step_type_filter == "step_type/value==Transform":
             inputs_observed_formatted = [x.__dict__ for x in inputs_observed]
-            inputs_expected_formatted = [x.__dict__ for x in self.inputs_expected]
         elif self.step_type_filter == "step_type/value==Training":
             # TrainingStep has a dict with values potentially being TrainingInput or
             # FileSystemInput
             inputs_observed_formatted = StepInputsAsExpected.format_training_inputs(inputs_observed)
-            inputs_expected_formatted = StepInputsAsExpected.format_training_inputs(
-                self.inputs_expected
-            )
+        inputs_expected_formatted = self.get_inputs_expected_formatted(self.step_type_filter)
         result = self.rule.run(inputs_observed_formatted, inputs_expected_formatted, self.name)
         return result
 
@@ -700,13 +1051,16 @@ class StepOutputsAsExpected(Validation):
         super().__init__(
             name="StepOutputsAsExpected",
             paths=[
-                f".steps[{self.step_filter} && step_type/value==Processing]].outputs",
-                f".steps[{self.step_filter} && step_type/value==Transform]].transformer."
+                f".steps[{self.step_filter} && step_type/value==Processing].outputs",
+                f".steps[{self.step_filter} && step_type/value==Transform].transformer."
                 f"output_path",
             ],
             rule=rule,
         )
         self.outputs_expected: List[Union[ProcessingOutput, str]] = outputs_expected
+        self.outputs_expected_formatted: List[Union[dict, str]] = [
+            x.__dict__ if not isinstance(x, str) else x for x in self.outputs_expected
+        ]
 
     def run(
         self,
@@ -728,10 +1082,9 @@ class StepOutputsAsExpected(Validation):
             else:
                 for item in output:
                     outputs_observed_formatted.append(item.__dict__)
-        outputs_expected_formatted = [
-            x.__dict__ if not isinstance(x, str) else x for x in self.outputs_expected
-        ]
-        result = self.rule.run(outputs_observed_formatted, outputs_expected_formatted, self.name)
+        result = self.rule.run(
+            outputs_observed_formatted, self.outputs_expected_formatted, self.name
+        )
         return result
 
 
@@ -754,6 +1107,32 @@ class StepOutputsMatchInputsAsExpected(Validation):
         )
         self.inputs_outputs_expected: List[Dict[str, Dict[str, str]]] = inputs_outputs_expected
 
+    @staticmethod
+    def _index_steps(sagemaker_pipeline: Pipeline) -> Dict[str, "ProcessingStep"]:  # noqa F821
+        """Index ProcessingStep, TrainingStep, TuningStep and TransformStep by name.
+
+        The first TransformStep is additionally indexed as 'transform'.
+
+        :param sagemaker_pipeline: SageMaker Pipeline
+        :type sagemaker_pipeline: sagemaker.workflow.pipeline.Pipeline
+        :return: Steps keyed by name
+        :rtype: Dict[str, ProcessingStep]
+        """
+        supported_step_types = (
+            StepTypeEnum.PROCESSING,
+            StepTypeEnum.TRAINING,
+            StepTypeEnum.TUNING,
+            StepTypeEnum.TRANSFORM,
+        )
+        steps_by_name = {}
+        for step in sagemaker_pipeline.steps:
+            step_type = step.step_type
+            if step_type is StepTypeEnum.TRANSFORM:
+                steps_by_name.setdefault("transform", step)
+            if step_type in supported_step_types:
+                steps_by_name.setdefault(step.name, step)
+        return steps_by_name
+
     @staticmethod
     def get_step_by_name(
         sagemaker_pipeline: Pipeline, step_name: str
@@ -767,12 +1146,12 @@ class StepOutputsMatchInputsAsExpected(Validation):
         :return: ProcessingStep
         :rtype: ProcessingStep
         """
-        supported_step_types = ("Processing", "Training", "Tuning", "Transform")
-        for step in sagemaker_pipeline.steps:
-            if step.step_type.value == "Transform" and step_name == "transform":
-                return step
-            elif step.name == step_name and step.step_type.value in supported_step_types:
-                return step
+        steps_by_name = _cached(
+            ("steps_by_name", id(sagemaker_pipeline)),
+            partial(StepOutputsMatchInputsAsExpected._index_steps, sagemaker_pipeline),
+        )
+        if step_name in steps_by_name:
+            return steps_by_name[step_name]
         raise ValueError(
             f"Processing, Training, Transform or Tuning Step {step_name} not found in Pipeline."
         )
@@ -794,17 +1173,17 @@ class StepOutputsMatchInputsAsExpected(Validation):
         :return: Input or Output path
         :rtype: str
         """
-        step_type = step.step_type.value
+        step_type = step.step_type
 
         if kind == "input":
             # If TrainingStep or TuningStep
-            if step_type in ("Training", "Tuning"):
+            if step_type is StepTypeEnum.TRAINING or step_type is StepTypeEnum.TUNING:
                 input = step.inputs[name]
                 if isinstance(input, TrainingInput):
                     return input.config["DataSource"]["S3DataSource"]["S3Uri"]
                 else:
                     raise ValueError(f"Input {name} is not of type TrainingInput.")
-            elif step_type == "Transform":
+            elif step_type is StepTypeEnum.TRANSFORM:
                 return step.inputs.data
             else:
                 # If ProcessingStep
@@ -814,11 +1193,11 @@ class StepOutputsMatchInputsAsExpected(Validation):
                 raise ValueError(f"Input {name} not found in ProcessingStep.")
 
         elif kind == "output":
-            if step_type == "Processing":
+            if step_type is StepTypeEnum.PROCESSING:
                 for output in step.outputs:
                     if output.output_name == name:
                         return output.destination
-            elif step_type == "Transform":
+            elif step_type is StepTypeEnum.TRANSFORM:
                 return step.transformer.output_path
 
     def run(
@@ -864,7 +1243,7 @@ class StepOutputsMatchInputsAsExpected(Validation):
         )
 
 
-class StepCallbackSqsQueueExists(Validation):
+class StepCallbackSqsQueueExists(_ResourcesExist):
     """Validate whether the SQS queue targeted by a CallbackStep exists."""
 
     def __init__(
@@ -884,7 +1263,7 @@ class StepCallbackSqsQueueExists(Validation):
             raise ValueError(f"boto3_client must be 'sqs', not {boto3_client}.")
         if boto3_client:
             self.client = (
-                boto3_client if not isinstance(boto3_client, str) else boto3.client(boto3_client)
+                boto3_client if not isinstance(boto3_client, str) else _default_client(boto3_client)
             )
 
         super().__init__(
@@ -894,6 +1273,22 @@ class StepCallbackSqsQueueExists(Validation):
             ],
         )
 
+    def queue_exists(self, queue_url: str) -> bool:
+        """Check whether an SQS queue exists.
+
+        :param queue_url: URL of the SQS queue
+        :type queue_url: str
+        :return: True if the SQS queue exists, False otherwise
+        :rtype: bool
+        """
+        try:
+            _ = self.client.get_queue_attributes(
+                QueueUrl=queue_url,
+            )
+        except ClientError:
+            return False
+        return True
+
     def run(
         self,
         sagemaker_pipeline: Pipeline,
@@ -905,17 +1300,13 @@ class StepCallbackSqsQueueExists(Validation):
         :return: validation result
         :rtype: ValidationResult
         """
-        sqs_url_observed = Validation.get_attribute(sagemaker_pipeline, self.paths)
-        exist = []
-        not_exist = []
-        for url in sqs_url_observed:
-            try:
-                _ = self.client.get_queue_attributes(
-                    QueueUrl=url,
-                )
-                exist.append(url)
-            except ClientError:
-                not_exist.append(url)
+        # Several CallbackSteps may target the same SQS queue, look each one up only once
+        sqs_url_observed = list(
+            dict.fromkeys(Validation.get_attribute(sagemaker_pipeline, self.paths))
+        )
+        exist, not_exist = self._partition_existing(
+            sqs_url_observed, "sqs_queue", self.queue_exists
+        )
         if not_exist:
             return ValidationResult(
                 success=False,
@@ -950,8 +1341,8 @@ class PipelineProcessingStepsIONamesUnique(Validation):
         super().__init__(
             name="PipelineProcessingStepsIONamesUnique",
             paths=[
-                ".steps[step_type/value==Processing]].outputs",
-                ".steps[step_type/value==Processing]].inputs",
+                ".steps[step_type/value==Processing].outputs",
+                ".steps[step_type/value==Processing].inputs",
             ],
         )
 
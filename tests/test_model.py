@@ -1,3 +1,7 @@
+import threading
+from functools import partial
+from unittest import mock
+
 import pandas as pd
 import pytest
 from moto import mock_ecr
@@ -7,6 +11,9 @@ from sagemaker_rightline.model import (
     Report,
     Validation,
     ValidationFailedError,
+    _cached,
+    _caching,
+    _compile_path,
 )
 from sagemaker_rightline.rules import Equals, Rule
 from sagemaker_rightline.validations import (
@@ -110,6 +117,72 @@ def test_configuration_run(
     assert observed_report_len == expected_report_length
 
 
+def test_configuration_run_max_workers(sagemaker_pipeline) -> None:
+    """Test run method of Configuration class with concurrent validations."""
+    validations = [
+        StepKmsKeyIdAsExpected(kms_key_id_expected="some/kms-key-alias", rule=Equals()),
+        StepKmsKeyIdAsExpected(kms_key_id_expected="other/kms-key-alias", rule=Equals()),
+        StepKmsKeyIdAsExpected(kms_key_id_expected="some/kms-key-alias", rule=Equals()),
+    ]
+    cf = Configuration(validations=validations, sagemaker_pipeline=sagemaker_pipeline)
+    report = cf.run(max_workers=2)
+    assert [result.success for result in report.results] == [True, False, True]
+
+
+def test_configuration_run_caches_attributes(sagemaker_pipeline) -> None:
+    """Test that paths shared by validations are traversed once per run."""
+    validations = [
+        StepKmsKeyIdAsExpected(kms_key_id_expected="some/kms-key-alias", rule=Equals()),
+        StepKmsKeyIdAsExpected(kms_key_id_expected="some/kms-key-alias", rule=Equals()),
+    ]
+    cf = Configuration(validations=validations, sagemaker_pipeline=sagemaker_pipeline)
+    with mock.patch.object(
+        Validation, "_get_path_attribute", wraps=Validation._get_path_attribute
+    ) as get_path_attribute:
+        report = cf.run()
+        assert get_path_attribute.call_count == len(validations[0].paths)
+        _ = Validation.get_attribute(sagemaker_pipeline, validations[0].paths)
+        assert get_path_attribute.call_count == 2 * len(validations[0].paths)
+    assert all(result.success for result in report.results)
+
+
+def test_configuration_run_cache_scoped_to_run(sagemaker_pipeline) -> None:
+    """Test that the run cache is seen by worker threads of a run, but not by other threads."""
+    calls = []
+
+    def run(_):
+        _cached("key", partial(calls.append, "worker"))
+        _cached("key", partial(calls.append, "worker"))
+        thread = threading.Thread(target=_cached, args=("key", partial(calls.append, "thread")))
+        thread.start()
+        thread.join()
+        return ValidationResult(
+            validation_name="validation",
+            success=True,
+            negative=False,
+            message="",
+            subject="",
+        )
+
+    validation = StepKmsKeyIdAsExpected(kms_key_id_expected="some/kms-key-alias", rule=Equals())
+    cf = Configuration(validations=[validation], sagemaker_pipeline=sagemaker_pipeline)
+    with mock.patch.object(StepKmsKeyIdAsExpected, "run", side_effect=run):
+        report = cf.run(max_workers=2)
+    assert calls == ["worker", "thread"]
+    assert report.results[0].success
+
+
+def test_caching_nested() -> None:
+    """Test that a nested _caching block reuses the cache of the outer block."""
+    calls = []
+    with _caching():
+        with _caching():
+            _cached("key", partial(calls.append, "inner"))
+        _cached("key", partial(calls.append, "outer"))
+    _cached("key", partial(calls.append, "uncached"))
+    assert calls == ["inner", "uncached"]
+
+
 def test_configuration_handle_empty_results(sagemaker_pipeline) -> None:
     """Test run method of Configuration class."""
     validation = StepKmsKeyIdAsExpected(
@@ -204,6 +277,48 @@ def test_validation_get_attribute_no_filter(sagemaker_pipeline) -> None:
     ]
 
 
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        [".parameters[]", (("attr", "parameters"),)],
+        [
+            ".steps[name==foo && step_type/value==Processing].processor.image_uri",
+            (
+                ("attr", "steps"),
+                ("filter", "steps[name==foo && step_type/value==Processing]"),
+                ("map", "processor"),
+                ("map", "image_uri"),
+            ),
+        ],
+    ],
+)
+def test_compile_path(path, expected) -> None:
+    """Test _compile_path function."""
+    assert _compile_path(path) == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "steps[name==foo].processor",
+        ".",
+        ".steps[name==foo]].outputs",
+        ".steps[name==foo.processor",
+        ".steps..processor",
+    ],
+)
+def test_compile_path_malformed(path) -> None:
+    """Test _compile_path function raises on malformed paths."""
+    with pytest.raises(ValueError):
+        _ = _compile_path(path)
+
+
+def test_validation_malformed_path() -> None:
+    """Test Validation raises on malformed paths when constructed."""
+    with pytest.raises(ValueError):
+        _ = StepKmsKeyIdAsExpected(kms_key_id_expected="key", rule=Equals(), step_name="foo]")
+
+
 def test_validation_failed_error():
     """Test ValidationFailedError class."""
     validation_result = ValidationResult(
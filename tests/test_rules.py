@@ -57,6 +57,9 @@ def test_equals(observed: List, expected: List, negative: bool, success: bool) -
             True,
         ],
         [[ParameterString(name="test3")], [ParameterString(name="test1")], False, False],
+        [[{"foo": "bar"}, {"bar": "foo"}], [{"bar": "foo"}], False, True],
+        [[{"foo": "bar"}], [{"bar": "foo"}], False, False],
+        [["test1", "test2"], [{"foo": "bar"}], False, False],
     ],
 )
 def test_contains_str(
@@ -1,14 +1,24 @@
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from unittest import mock
 
+import boto3
 import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from moto import mock_ecr, mock_iam, mock_lambda, mock_sqs
 from sagemaker.inputs import FileSystemInput, TrainingInput, TransformInput
 from sagemaker.processing import NetworkConfig, ProcessingInput, ProcessingOutput
+from sagemaker.sklearn.estimator import SKLearn
 from sagemaker.workflow.functions import Join
 from sagemaker.workflow.parameters import ParameterString
 from sagemaker.workflow.pipeline import ExecutionVariables
+from sagemaker.workflow.pipeline_context import PipelineSession
+from sagemaker.workflow.steps import TrainingStep
 
-from sagemaker_rightline.model import Validation, ValidationResult
+from sagemaker_rightline.model import Validation, ValidationResult, _caching
 from sagemaker_rightline.rules import Contains, Equals
 from sagemaker_rightline.validations import (
     ContainerImage,
@@ -25,13 +35,17 @@ from sagemaker_rightline.validations import (
     StepRoleNameAsExpected,
     StepRoleNameExists,
     StepTagsAsExpected,
+    _parse_image,
+    _role_name,
 )
 from tests.fixtures.constants import (
     TEST_ACCOUNT_ID,
     TEST_LAMBDA_FUNC_NAME,
     TEST_REGION_NAME,
+    TEST_ROLE_ARN,
     TEST_ROLE_NAME,
     TEST_SQS_QUEUE_NAME,
+    TEST_SQS_QUEUE_URL,
     TEST_SQS_QUEUE_URL_BASE,
 )
 from tests.fixtures.image_details import (
@@ -65,6 +79,33 @@ def test_container_image() -> None:
     assert container_image.repository == IMAGE_1_REPOSITORY_NAME
     assert container_image.region == TEST_REGION_NAME
     assert container_image.tag == IMAGE_1_TAG
+    assert container_image == ContainerImage(uri=IMAGE_1_URI)
+    with pytest.raises(FrozenInstanceError):
+        container_image.tag = "some-other-tag"
+
+
+@pytest.mark.parametrize(
+    "copy_function",
+    [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+)
+def test_container_image_copy(copy_function) -> None:
+    container_image = ContainerImage(uri=IMAGE_1_URI)
+    container_image_copy = copy_function(container_image)
+    assert container_image_copy == container_image
+    assert container_image_copy.tag == IMAGE_1_TAG
+    with pytest.raises(FrozenInstanceError):
+        container_image_copy.tag = "some-other-tag"
+
+
+def test_parse_image() -> None:
+    container_image = _parse_image(IMAGE_1_URI)
+    assert container_image == ContainerImage(uri=IMAGE_1_URI)
+    assert _parse_image(IMAGE_1_URI) is container_image
+
+
+def test_container_image_invalid_uri() -> None:
+    with pytest.raises(ValueError):
+        _ = ContainerImage(uri="some-image:latest")
 
 
 def test_validation_result() -> None:
@@ -111,6 +152,139 @@ def test_step_image_exists_run_negative(sagemaker_pipeline) -> None:
     assert result.message.endswith(" not exist.")
 
 
+@mock_ecr
+def test_step_image_exists_get_existing_images(ecr_client) -> None:
+    container_image = ContainerImage(uri=IMAGE_1_URI)
+    repository = (container_image.account_id, container_image.repository)
+    image_exists = StepImagesExist()
+    with ThreadPoolExecutor() as executor:
+        with create_image(ecr_client, [container_image]):
+            existing_images = image_exists._get_existing_images(
+                executor, {repository: [container_image.tag, "nonexistent-tag"]}
+            )
+            assert existing_images == {(*repository, container_image.tag)}
+
+        existing_images = image_exists._get_existing_images(
+            executor, {repository: [container_image.tag]}
+        )
+        assert existing_images == set()
+
+
+def test_step_image_exists_get_existing_images_bisects_failed_batches() -> None:
+    tags = [f"tag-{ix}" for ix in range(16)]
+
+    def describe_images(registryId, repositoryName, imageIds):
+        image_tags = [image_id["imageTag"] for image_id in imageIds]
+        if "tag-3" in image_tags:
+            raise ClientError(
+                {"Error": {"Code": "ImageNotFoundException", "Message": ""}}, "DescribeImages"
+            )
+        return {"imageDetails": [{"imageTags": image_tags}]}
+
+    client = mock.Mock()
+    client.describe_images.side_effect = describe_images
+    image_exists = StepImagesExist(boto3_client=client)
+    with ThreadPoolExecutor() as executor:
+        existing_images = image_exists._get_existing_images(
+            executor, {(TEST_ACCOUNT_ID, "repository"): tags}
+        )
+    assert existing_images == {
+        (TEST_ACCOUNT_ID, "repository", tag) for tag in tags if tag != "tag-3"
+    }
+    # One failed request of 16 tags, then two requests of each of 8, 4, 2 and 1 tags
+    assert client.describe_images.call_count == 9
+
+
+@mock_ecr
+def test_step_image_exists_run_deduplicates_uris(sagemaker_pipeline) -> None:
+    image_exists = StepImagesExist()
+    with mock.patch.object(
+        Validation, "get_attribute", return_value=[IMAGE_1_URI, IMAGE_1_URI, IMAGE_2_URI]
+    ):
+        result = image_exists.run(sagemaker_pipeline)
+    assert not result.success
+    assert result.subject == str([IMAGE_1_URI, IMAGE_2_URI])
+
+
+def test_step_image_exists_run_no_images(sagemaker_pipeline) -> None:
+    image_exists = StepImagesExist()
+    with mock.patch.object(image_exists, "_get_existing_images") as get_existing_images:
+        with mock.patch.object(Validation, "get_attribute", return_value=[]):
+            result = image_exists.run(sagemaker_pipeline)
+    assert result.success
+    assert result.subject == "[]"
+    get_existing_images.assert_not_called()
+
+
+@mock_ecr
+def test_step_image_exists_run_caches_lookups(sagemaker_pipeline) -> None:
+    image_exists = StepImagesExist()
+    with mock.patch.object(
+        image_exists, "_describe_tags", wraps=image_exists._describe_tags
+    ) as describe_tags:
+        with _caching():
+            first = image_exists.run(sagemaker_pipeline)
+            second = image_exists.run(sagemaker_pipeline)
+        call_count = describe_tags.call_count
+        _ = image_exists.run(sagemaker_pipeline)
+
+    assert first == second
+    assert call_count > 0
+    assert describe_tags.call_count == 2 * call_count
+
+
+def test_step_image_exists_run_caches_images_of_overlapping_tags(sagemaker_pipeline) -> None:
+    uri = f"{TEST_ACCOUNT_ID}.dkr.ecr.{TEST_REGION_NAME}.amazonaws.com/repository"
+    client = mock.Mock()
+    client.describe_images.return_value = {"imageDetails": [{"imageTags": ["a", "b"]}]}
+    image_exists = StepImagesExist(boto3_client=client)
+    with _caching():
+        with mock.patch.object(Validation, "get_attribute", return_value=[f"{uri}:a", f"{uri}:b"]):
+            first = image_exists.run(sagemaker_pipeline)
+        with mock.patch.object(Validation, "get_attribute", return_value=[f"{uri}:a"]):
+            second = image_exists.run(sagemaker_pipeline)
+    assert first.success
+    assert second.success
+    client.describe_images.assert_called_once()
+
+
+def test_default_client_shared() -> None:
+    assert StepImagesExist().client is StepImagesExist().client
+    assert StepImagesExist().client.meta.config.retries["mode"] == "adaptive"
+    assert StepLambdaFunctionExists().client is not StepImagesExist().client
+
+
+def test_default_client_follows_default_session(monkeypatch) -> None:
+    client = StepImagesExist().client
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-central-1")
+    regional_client = StepImagesExist().client
+    assert regional_client is not client
+    assert regional_client.meta.region_name == "eu-central-1"
+    monkeypatch.setattr(boto3, "DEFAULT_SESSION", None)
+    boto3.setup_default_session(region_name="eu-west-2")
+    session_client = StepImagesExist().client
+    assert session_client.meta.region_name == "eu-west-2"
+    assert StepImagesExist().client is session_client
+
+
+@pytest.mark.parametrize(
+    "max_pool_connections,max_workers",
+    [[2, 2], [StepImagesExist.MAX_WORKERS + 1, StepImagesExist.MAX_WORKERS]],
+)
+def test_max_workers_bounded_by_connection_pool(max_pool_connections, max_workers) -> None:
+    client = boto3.client("ecr", config=Config(max_pool_connections=max_pool_connections))
+    assert StepImagesExist(boto3_client=client)._max_workers() == max_workers
+
+
+def test_max_workers_client_without_connection_pool() -> None:
+    lambda_function_exists = StepLambdaFunctionExists(boto3_client=mock.Mock())
+    assert lambda_function_exists._max_workers() == StepLambdaFunctionExists.MAX_WORKERS
+    exist, not_exist = lambda_function_exists._partition_existing(
+        [TEST_LAMBDA_FUNC_NAME], "lambda_function", lambda _: True
+    )
+    assert (exist, not_exist) == ([TEST_LAMBDA_FUNC_NAME], [])
+
+
 def test_step_image_exists_wrong_client() -> None:
     with pytest.raises(ValueError):
         _ = StepImagesExist(boto3_client="not-a-boto3-client")
@@ -200,6 +374,20 @@ def test_pipeline_parameters_ignore_default_value(
     assert result.success == success
 
 
+def test_pipeline_parameters_ignore_default_value_does_not_mutate(sagemaker_pipeline) -> None:
+    default_values = [parameter.default_value for parameter in sagemaker_pipeline.parameters]
+    pipeline_parameters = PipelineParametersAsExpected(
+        parameters_expected=[ParameterString(name="parameter-1")],
+        ignore_default_value=True,
+        rule=Contains(),
+    )
+    result = pipeline_parameters.run(sagemaker_pipeline)
+    assert result.success
+    assert [parameter.default_value for parameter in sagemaker_pipeline.parameters] == (
+        default_values
+    )
+
+
 def test_has_parameters_raise() -> None:
     with pytest.raises(ValueError):
         _ = PipelineParametersAsExpected(parameters_expected=[], rule=Equals())
@@ -347,6 +535,66 @@ def test_step_network_config_filter(
     assert result.success == success
 
 
+def test_step_network_config_get_training_step_network_config_none_values() -> None:
+    estimator = mock.Mock(
+        enable_network_isolation=lambda: True,
+        security_group_ids=None,
+        subnets=["subnet-12345"],
+        encrypt_inter_container_traffic=False,
+    )
+    (network_config,) = StepNetworkConfigAsExpected.get_training_step_network_config([estimator])
+    assert network_config.__dict__ == {
+        "enable_network_isolation": True,
+        "security_group_ids": None,
+        "subnets": ["subnet-12345"],
+        "encrypt_inter_container_traffic": False,
+    }
+
+
+def test_step_network_config_get_training_step_network_configs(sagemaker_pipeline) -> None:
+    network_configs = StepNetworkConfigAsExpected._get_training_step_network_configs(
+        sagemaker_pipeline
+    )
+    assert list(network_configs) == ["sm_training_step_sklearn"]
+    assert network_configs["sm_training_step_sklearn"]["subnets"] == ["subnet-12345"]
+
+
+def test_step_network_config_no_step_name_skips_training_steps(sagemaker_pipeline) -> None:
+    step_network_config = StepNetworkConfigAsExpected(
+        network_config_expected=NetworkConfig(), rule=Equals()
+    )
+    with mock.patch.object(
+        StepNetworkConfigAsExpected, "_get_training_step_network_configs"
+    ) as get_training_step_network_configs:
+        _ = step_network_config.run(sagemaker_pipeline)
+    get_training_step_network_configs.assert_not_called()
+
+
+def test_step_network_config_training_step_args(sagemaker_pipeline) -> None:
+    estimator = SKLearn(
+        entry_point="tests/fixtures/fake_processing_script.py",
+        role=TEST_ROLE_ARN,
+        image_uri=IMAGE_1_URI,
+        instance_type="ml.c4.xlarge",
+        sagemaker_session=PipelineSession(default_bucket=DUMMY_BUCKET),
+    )
+    sagemaker_pipeline.steps.append(
+        TrainingStep(name="sm_training_step_args", step_args=estimator.fit())
+    )
+    step_network_config = StepNetworkConfigAsExpected(
+        network_config_expected=NetworkConfig(
+            enable_network_isolation=True,
+            security_group_ids=["sg-12345"],
+            subnets=["subnet-12345"],
+            encrypt_inter_container_traffic=True,
+        ),
+        rule=Equals(),
+        step_name="sm_processing_step_sklearn",
+    )
+    result = step_network_config.run(sagemaker_pipeline)
+    assert result.success
+
+
 @mock_iam
 @mock_lambda
 def test_lambda_function_exists_positive(lambda_client, iam_client, sagemaker_pipeline) -> None:
@@ -363,6 +611,57 @@ def test_lambda_function_exists_negative(lambda_client, sagemaker_pipeline) -> N
     assert not result.success
 
 
+@mock_iam
+@mock_lambda
+def test_lambda_function_exists_function_exists(lambda_client, iam_client) -> None:
+    lambda_function_exists = StepLambdaFunctionExists()
+    with create_lambda_function(lambda_client, iam_client, [TEST_LAMBDA_FUNC_NAME]):
+        assert lambda_function_exists.function_exists(TEST_LAMBDA_FUNC_NAME)
+    assert not lambda_function_exists.function_exists(TEST_LAMBDA_FUNC_NAME)
+
+
+@pytest.mark.parametrize(
+    "validation_cls,check,observed,item",
+    [
+        [
+            StepLambdaFunctionExists,
+            "function_exists",
+            [TEST_LAMBDA_FUNC_NAME, TEST_LAMBDA_FUNC_NAME],
+            TEST_LAMBDA_FUNC_NAME,
+        ],
+        [StepRoleNameExists, "role_exists", [TEST_ROLE_ARN, TEST_ROLE_NAME], TEST_ROLE_NAME],
+        [
+            StepCallbackSqsQueueExists,
+            "queue_exists",
+            [TEST_SQS_QUEUE_URL, TEST_SQS_QUEUE_URL],
+            TEST_SQS_QUEUE_URL,
+        ],
+    ],
+)
+def test_resources_exist_deduplicates(
+    validation_cls, check, observed, item, sagemaker_pipeline
+) -> None:
+    validation = validation_cls()
+    with mock.patch.object(validation, check, return_value=True) as check_mock:
+        with mock.patch.object(Validation, "get_attribute", return_value=observed):
+            result = validation.run(sagemaker_pipeline)
+    assert result.success
+    assert result.subject == str([item])
+    check_mock.assert_called_once_with(item)
+
+
+@pytest.mark.parametrize(
+    "role_arn,role_name",
+    [
+        [f"arn:aws:iam::{TEST_ACCOUNT_ID}:role/{TEST_ROLE_NAME}", TEST_ROLE_NAME],
+        [f"arn:aws:iam::{TEST_ACCOUNT_ID}:role/service-role/{TEST_ROLE_NAME}", TEST_ROLE_NAME],
+        [TEST_ROLE_NAME, TEST_ROLE_NAME],
+    ],
+)
+def test_role_name(role_arn, role_name) -> None:
+    assert _role_name(role_arn) == role_name
+
+
 @mock_iam
 def test_role_exists_positive(iam_client, sagemaker_pipeline) -> None:
     with create_iam_role(iam_client, [TEST_ROLE_NAME]):
@@ -371,6 +670,25 @@ def test_role_exists_positive(iam_client, sagemaker_pipeline) -> None:
     assert result.success
 
 
+@mock_iam
+def test_role_exists_role_exists(iam_client) -> None:
+    role_exists = StepRoleNameExists()
+    with create_iam_role(iam_client, [TEST_ROLE_NAME]):
+        assert role_exists.role_exists(TEST_ROLE_NAME)
+    assert not role_exists.role_exists(TEST_ROLE_NAME)
+
+
+@mock_iam
+def test_role_exists_run_caches_lookups(iam_client, sagemaker_pipeline) -> None:
+    with mock.patch.object(
+        StepRoleNameExists, "role_exists", return_value=True
+    ) as role_exists_mock:
+        with _caching():
+            _ = StepRoleNameExists().run(sagemaker_pipeline)
+            _ = StepRoleNameExists(step_name="sm_training_step_sklearn").run(sagemaker_pipeline)
+    role_exists_mock.assert_called_once_with(TEST_ROLE_NAME)
+
+
 @mock_iam
 def test_role_exists_negative(iam_client, sagemaker_pipeline) -> None:
     role_exists = StepRoleNameExists()
@@ -707,6 +1025,23 @@ def test_step_inputs_as_expected_filter(
     assert result.success == success
 
 
+def test_step_inputs_as_expected_formats_expected_once(sagemaker_pipeline) -> None:
+    step_inputs_validation = StepInputsAsExpected(
+        inputs_expected=[TransformInput(data=f"s3://{DUMMY_BUCKET}/output-1")],
+        step_name="sm_transform_step",
+        rule=Equals(),
+    )
+    assert step_inputs_validation.inputs_expected_formatted == {}
+    _ = step_inputs_validation.run(sagemaker_pipeline)
+    formatted = step_inputs_validation.get_inputs_expected_formatted("step_type/value==Transform")
+    _ = step_inputs_validation.run(sagemaker_pipeline)
+    assert list(step_inputs_validation.inputs_expected_formatted) == ["step_type/value==Transform"]
+    assert (
+        step_inputs_validation.get_inputs_expected_formatted("step_type/value==Transform")
+        is formatted
+    )
+
+
 def test_step_inputs_as_expected_args_validation_step_type() -> None:
     with pytest.raises(ValueError):
         StepInputsAsExpected(
@@ -1083,6 +1418,28 @@ def test_step_outputs_match_inputs_as_expected(
         assert result.success is success
 
 
+@pytest.mark.parametrize(
+    "step_name,expected_step_name",
+    [
+        ["sm_processing_step_sklearn", "sm_processing_step_sklearn"],
+        ["sm_tuning_step", "sm_tuning_step"],
+        ["transform", "sm_transform_step"],
+        ["sm_transform_step", "sm_transform_step"],
+        ["sm_lambda_step", None],
+        ["nonexistent-step", None],
+    ],
+)
+def test_step_outputs_match_inputs_get_step_by_name(
+    sagemaker_pipeline, step_name, expected_step_name
+) -> None:
+    if expected_step_name is None:
+        with pytest.raises(ValueError):
+            _ = StepOutputsMatchInputsAsExpected.get_step_by_name(sagemaker_pipeline, step_name)
+    else:
+        step = StepOutputsMatchInputsAsExpected.get_step_by_name(sagemaker_pipeline, step_name)
+        assert step.name == expected_step_name
+
+
 @mock_sqs
 @mock_iam
 def test_sqs_queue_exists_positive(sqs_client, iam_client, sagemaker_pipeline) -> None:
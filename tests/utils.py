@@ -85,11 +85,6 @@ def create_image(ecr_client, container_images: List[ContainerImage]) -> None:
         )
     yield
     for container_image in container_images:
-        _ = ecr_client.batch_delete_image(
-            registryId=container_image.account_id,
-            repositoryName=container_image.repository,
-            imageIds=[{"imageTag": container_image.tag}],
-        )
         _ = ecr_client.delete_repository(
             registryId=container_image.account_id,
             repositoryName=container_image.repository,